@@ -14,25 +14,81 @@ Markdownの見出し（#）は階層構造として解釈し、表（|）は対
 
 import os
 import re
+import codecs
+import functools
 import sys
 import argparse
 import logging
 import traceback
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 from datetime import datetime
 
+# lxmlが利用可能な場合、openpyxlは高速なストリーミングシリアライザを使用する
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 # ロガー設定
 logger = logging.getLogger(__name__)
 
+# NumPyによる一括計算に切り替える列のテキスト量（文字数）の目安
+# これより小さい列ではNumPy配列の生成コストの方が大きいため、1セルずつ計算する
+_BULK_WIDTH_MIN_CHARS = 4096
+
+# 列番号（1始まり）に対応する列名の事前計算テーブル
+# 1024列を超える場合のみget_column_letterで都度計算する
+_COL_LETTERS = tuple(get_column_letter(i) for i in range(1, 1025))
+
+# 表示幅が2となる文字（CJK記号・かな・漢字と全角英数字・記号）を削除する変換表
+# str.translateで削除した後の長さとの差から、全角文字の数をC実装の走査で数える
+_WIDE_CHARS_DELETE = dict.fromkeys([*range(0x3000, 0xa000), *range(0xff01, 0xff61)])
+
+# エンコーディングの自動検出に使用する先頭部分のサイズ（バイト）
+_DETECT_SAMPLE_SIZE = 64 * 1024
+
+# 文字コード判定ライブラリを使用する非ASCIIバイト数の下限
+# これより少ない場合はShift-JISとEUC-JPのどちらとしても読めることが多く、判定結果が安定しない
+_DETECT_MIN_NON_ASCII_BYTES = 32
+_ASCII_BYTES = bytes(range(0x80))
+
+# Markdownファイルを読み込む単位（文字数）
+_READ_CHUNK_SIZE = 64 * 1024
+
+# 正規表現パターン（行ごと・セルごとに使用するため、モジュール読み込み時に一度だけコンパイルする）
+# 行の種類ごとの正規表現。最後の名前付きグループ（lastgroup）が行の種類を表す
+_HEADING_RE = re.compile(r'^(?P<level>#{1,6})\s+(?P<heading>.+)$')  # 見出し
+_TABLE_ROW_RE = re.compile(r'^(?P<table>\|(?:.*\|)?)$')  # 表（「|」で始まり「|」で終わる行）
+_LIST_ITEM_RE = re.compile(r'^(?P<indent>\s*)[-*+]\s+(?P<item>.+)$')  # 箇条書き
+
+# 行頭の1文字から照合すべき正規表現を引く表
+# 該当しない文字で始まる行は正規表現を使わずに通常のテキストとして扱う
+_LINE_START_PATTERNS = {
+    '#': _HEADING_RE,
+    '|': _TABLE_ROW_RE,
+    '-': _LIST_ITEM_RE,
+    '*': _LIST_ITEM_RE,
+    '+': _LIST_ITEM_RE,
+    ' ': _LIST_ITEM_RE,
+    '\t': _LIST_ITEM_RE,
+}
+_NUMERIC_RE = re.compile(r'^-?\d{1,3}(?:,\d{3})*(?:\.\d+)?$|^-?\d+(?:\.\d+)?$')  # 数値（桁区切りの「,」を含む）
+
 # 例外をキャッチしてロギングするデコレータ
 def log_exceptions(func):
     """
     関数の例外をキャッチしてログに記録するデコレータ
+    呼び出しごとにフレームが1つ増えるため、convertなどの最上位のメソッドにのみ使用する
+    （行やセル単位で呼ばれる内部処理には適用しない）
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -43,10 +99,334 @@ def log_exceptions(func):
     return wrapper
 
 
+def _flush(section, paragraph_lines=None, current_list=None, current_table=None, current_align=None):
+    """
+    保留中の段落・リスト・表をセクションに追加する
+    
+    Parameters:
+        section (dict): 追加先のセクション（Noneの場合は破棄する）
+        paragraph_lines (list, optional): 保留中の段落の行
+        current_list (list, optional): 保留中のリストの項目
+        current_table (list, optional): 保留中の表の行
+        current_align (list, optional): 保留中の表の整列情報
+        
+    Returns:
+        tuple: 初期化後の (段落の行, リストの項目, 表の行, リスト内か, 表内か)
+    """
+    if section:
+        if paragraph_lines:
+            section['paragraphs'].append('\n'.join(paragraph_lines))
+        if current_list:
+            section['lists'].append(current_list)
+        if current_table:
+            section['tables'].append({
+                'rows': current_table,
+                'align': current_align,
+                'numeric': _classify_numeric_columns(current_table, current_align)
+            })
+    return [], [], [], False, False
+
+
+def _iter_lines(file, chunk_size=_READ_CHUNK_SIZE):
+    """
+    テキストファイルを一定サイズずつ読み込み、改行を含まない行を順に返す
+    
+    Parameters:
+        file (file object): テキストモードで開いたファイル（改行コードは自動的に統一される）
+        chunk_size (int, optional): 一度に読み込む文字数
+        
+    Yields:
+        str: 末尾の改行を除いた各行
+    """
+    tail = ''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split('\n')
+        # 最後の要素は次のチャンクに続く可能性があるため持ち越す
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def _classify_numeric_columns(rows, align):
+    """
+    表の列ごとに、全てのデータセル（空のセルを除く）が数値かどうかを一度だけ判定する
+    セパレータ行の整列情報で配置が決まっている列は判定しない
+    
+    Parameters:
+        rows (list): 表の行（先頭はヘッダー行）
+        align (list, optional): 表の整列情報
+        
+    Returns:
+        list: 列ごとの判定結果（Trueの場合は数値の列）
+    """
+    ncols = max(len(row) for row in rows)
+    numeric = [False] * ncols
+    data_rows = rows[1:]
+    for col in range(len(align) if align else 0, ncols):
+        values = [row[col] for row in data_rows if col < len(row) and row[col]]
+        numeric[col] = bool(values) and all(_NUMERIC_RE.match(value) for value in values)
+    return numeric
+
+
+def _split_table_row(line):
+    """
+    表の行（「|」で始まり「|」で終わる行）をセルに分割する
+    
+    Parameters:
+        line (str): 表の行
+        
+    Returns:
+        list: 前後の空白を除いたセルのリスト
+    """
+    body = line.strip('|')
+    if body[:1] == ' ' and body[-1:] == ' ':
+        # 「| a | b |」のように区切りの前後が空白1つの一般的な書式では、空白ごと区切って
+        # 各セルの空白除去で新しい文字列を作らないようにする
+        # 区切り以外に「|」が残る場合（「a|b」や空のセルなど）は通常の分割に戻す
+        cells = body[1:-1].split(' | ')
+        if body.count('|') != len(cells) - 1:
+            cells = body.split('|')
+    else:
+        cells = body.split('|')
+    return [cell.strip() for cell in cells]
+
+
+def _classify_sep_row(cells):
+    """
+    表の行がセパレータ行（---）かどうかを判定し、同時に整列情報を取得する
+    
+    Parameters:
+        cells (list): 前後の空白を除いた表のセル
+        
+    Returns:
+        list: セパレータ行の場合は列ごとの整列情報（'left'、'right'、'center'）、それ以外はNone
+    """
+    aligns = []
+    for cell in cells:
+        # 「-」「:」と空白以外の文字を含むセルがあればセパレータ行ではない
+        if not cell or cell.strip('-: \t'):
+            return None
+        left, right = cell[0] == ':', cell[-1] == ':'
+        aligns.append('center' if left and right else 'right' if right else 'left')
+    return aligns
+
+
+def _iter_sections(lines):
+    """
+    Markdownの行を順に解析し、セクション構造として抽出する
+    ファイルの読み込みとは独立した純粋な関数として、行単位の状態遷移だけを扱う
+    セクションは次の見出しに達した時点（最後のセクションは入力の終わり）で完成したものから順に返す
+    
+    Parameters:
+        lines (iterable): Markdownの各行（末尾の改行は含んでいてもよい）
+        
+    Yields:
+        dict: セクション。表は {'rows': 行のリスト, 'align': 整列情報（なければNone）,
+              'numeric': 列ごとの数値判定} の辞書
+    """
+    current_section = None
+    in_table = False
+    current_table = []
+    current_align = None
+    paragraph_lines = []
+    in_list = False
+    current_list = []
+    
+    for line in lines:
+        # 末尾に空白がある場合のみ新しい文字列を作成する
+        if line and line[-1].isspace():
+            line = line.rstrip()
+        
+        # 行の種類を判定（いずれにも該当しない場合は通常のテキスト）
+        # 末尾の空白は除去済みのため、空白のみの行は空文字列になっている
+        if line:
+            head = line[0]
+            pattern = _LINE_START_PATTERNS.get(head)
+            if pattern is None and head.isspace():
+                # 全角スペースなど表にない空白で字下げされた箇条書き
+                pattern = _LIST_ITEM_RE
+            match = pattern.match(line) if pattern is not None else None
+            kind = match.lastgroup if match else None
+        else:
+            kind = 'blank'
+        
+        # 見出しの検出
+        if kind == 'heading':
+            # 前の段落・リスト・表を処理（保留中のものがない場合は何もしない）
+            if paragraph_lines or current_list or in_table:
+                paragraph_lines, current_list, current_table, in_list, in_table = _flush(
+                    current_section, paragraph_lines, current_list, current_table, current_align)
+            
+            # 完成したセクションを返す
+            if current_section is not None:
+                yield current_section
+            
+            # 新しいセクションを作成
+            level = len(match.group('level'))
+            text = match.group('heading')
+            
+            current_section = {
+                'heading': text,
+                'level': level,
+                'paragraphs': [],
+                'lists': [],
+                'tables': []
+            }
+            continue
+        
+        # 表の処理
+        if kind == 'table':
+            # 前の段落・リストを処理
+            if paragraph_lines or current_list:
+                paragraph_lines, current_list, _, in_list, _ = _flush(
+                    current_section, paragraph_lines, current_list)
+            
+            if not in_table:
+                # 新しい表の開始
+                in_table = True
+                current_table = []
+                table_append = current_table.append  # 表の行ごとの属性参照を省く
+                current_align = None
+            
+            # 表の行を追加
+            cells = _split_table_row(line)
+            
+            # セパレータ行（---）をスキップするが、整列情報は保存
+            # 「|」「-」「:」と空白以外の文字を含む行はセパレータ行になり得ないため、セルごとの判定を省く
+            if not line.strip('|-: \t'):
+                align_info = _classify_sep_row(cells)
+                if align_info is not None:
+                    # この表の整列情報として保存
+                    current_align = align_info
+                    
+                    continue
+            
+            table_append(cells)
+            continue
+        elif in_table:
+            # 表の終了
+            _, _, current_table, _, in_table = _flush(
+                current_section, current_table=current_table, current_align=current_align)
+        
+        # 箇条書きの処理
+        if kind == 'item':
+            # 前の段落を処理
+            if paragraph_lines:
+                paragraph_lines, _, _, _, _ = _flush(current_section, paragraph_lines)
+            
+            if not in_list:
+                # 新しいリストの開始
+                in_list = True
+                current_list = []
+                list_append = current_list.append  # 項目ごとの属性参照を省く
+            
+            # リストアイテムを追加
+            indent = len(match.group('indent'))
+            content = match.group('item')
+            list_append((indent, content))
+            continue
+        elif in_list and kind != 'blank':
+            # リストの終了（空行でも箇条書きでもない行があれば終了）
+            _, current_list, _, in_list, _ = _flush(current_section, current_list=current_list)
+            
+            # 次の処理に続く（この行は通常のテキストとして扱う）
+        
+        # 空行の処理
+        if kind == 'blank':
+            # 前の段落・リストを処理
+            if paragraph_lines or current_list:
+                paragraph_lines, current_list, _, in_list, _ = _flush(
+                    current_section, paragraph_lines, current_list)
+            continue
+        
+        # 通常のテキスト（リストは直前で終了しているため、常に段落の行となる）
+        paragraph_lines.append(line)
+    
+    # 残りの段落、リスト、表を処理
+    _flush(current_section, paragraph_lines, current_list, current_table, current_align)
+    
+    if current_section is not None:
+        yield current_section
+
+
+@functools.lru_cache(maxsize=8192)
+def _measure_column_width(text):
+    """
+    テキストの表示幅からカラム幅を計算する（_get_column_widthの計算本体）
+    
+    Parameters:
+        text (str): セルのテキスト
+        
+    Returns:
+        float: 推奨されるカラム幅
+    """
+    # 日本語文字（CJK記号・かな・漢字）と全角英数字・記号: 2幅、それ以外の半角文字: 1幅
+    # 改行を含む場合は最も長い行の幅を採用する
+    best_line = 0
+    for line in (text.split('\n') if '\n' in text else (text,)):
+        if line.isascii():
+            line_width = len(line)
+        else:
+            # 全角文字を削除して減った文字数が全角文字の数
+            line_width = 2 * len(line) - len(line.translate(_WIDE_CHARS_DELETE))
+        if line_width > best_line:
+            best_line = line_width
+    
+    # 基本幅 + 文字幅
+    # 余裕を持たせるために係数1.2をかける
+    width = 2.0 + best_line * 1.2
+    
+    return min(max(width, 10.0), 60.0)  # 最小10、最大60の幅に制限
+
+
 class MdToExcelConverter:
     VERSION = "1.2.0"  # バージョン情報を更新
+    ENGINES = ('xlsxwriter', 'openpyxl')  # 対応している出力エンジン
+    ENCODINGS = ('utf-8', 'shift-jis', 'euc-jp', 'iso-2022-jp')  # 対応している入力ファイルの文字コード
+    SHEET_NAME_MAX_LENGTH = 31  # Excelのシート名の最大文字数
+    SHEET_NAME_INVALID_CHARS = '[]:*?/\\'  # Excelのシート名に使用できない文字
     
-    def __init__(self, md_file, output_file=None, sheet_name="Sheet1", debug=False):
+    # 共有スタイルオブジェクト
+    # openpyxlは同一のスタイルオブジェクトを使い回すと重複排除が効くため、セルごとに生成しない
+    _PARA_FONT = Font(name='メイリオ', size=11)
+    _LIST_FONT = Font(name='メイリオ', size=11)
+    _DATA_FONT = Font(name='メイリオ', size=11)
+    _ALIGN_LEFT = Alignment(horizontal='left', vertical='center')
+    _ALIGN_RIGHT = Alignment(horizontal='right', vertical='center')
+    _ALIGN_CENTER = Alignment(horizontal='center', vertical='center')
+    _ALIGN_WRAP_CENTER = Alignment(wrap_text=True, vertical='center')
+    _HEADING_ROW_HEIGHT = 24  # 見出し行の高さ
+    _THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    
+    # 見出しレベル（1〜6）ごとの文字サイズと背景色。どちらの出力エンジンもこの表からスタイルを作成する
+    # 見出しレベルをそのまま添字に使うため、0番目は未使用
+    _HEADING_PALETTE = (
+        None,
+        (16, "DDEBF7"),
+        (14, "E2EFDA"),
+        (12, "FCE4D6"),
+        (11, "FFF2CC"),
+        (10, "F2F2F2"),
+        (10, "F2F2F2")
+    )
+    
+    # openpyxl用の見出しスタイル（_HEADING_PALETTEと同じ添字）
+    _HEADING_FONTS = (None,) + tuple(
+        Font(name='メイリオ', bold=True, size=size, color="000000") for size, _ in _HEADING_PALETTE[1:])
+    _HEADING_FILLS = (None,) + tuple(
+        PatternFill(start_color=color, end_color=color, fill_type="solid") for _, color in _HEADING_PALETTE[1:])
+    _HEADING_ALIGNMENTS = (None,) + tuple(Alignment(indent=level - 1) for level in range(1, 7))
+    
+    def __init__(self, md_file, output_file=None, sheet_name="Sheet1", debug=False, engine="xlsxwriter"):
         """
         初期化メソッド
         
@@ -55,12 +435,27 @@ class MdToExcelConverter:
             output_file (str, optional): 出力Excelファイルのパス。デフォルトはNone（MDファイル名から自動生成）
             sheet_name (str, optional): 出力Excelファイルのシート名。デフォルトは"Sheet1"
             debug (bool, optional): デバッグモードを有効にするかどうか。デフォルトはFalse
+            engine (str, optional): Excelの出力エンジン（"xlsxwriter"または"openpyxl"）。デフォルトは"xlsxwriter"
         """
         # デバッグモードの設定
         if debug:
             logger.setLevel(logging.DEBUG)
             logger.debug("デバッグモードが有効です")
         
+        if engine not in self.ENGINES:
+            raise ValueError(f"未対応の出力エンジンです: {engine}（{', '.join(self.ENGINES)}のいずれかを指定してください）")
+        
+        # シート名の検証（どちらのエンジンでもワークブックの作成前に確定させる）
+        invalid_chars = [char for char in self.SHEET_NAME_INVALID_CHARS if char in sheet_name]
+        if invalid_chars:
+            raise ValueError(f"シート名に使用できない文字が含まれています: {' '.join(invalid_chars)}")
+        if sheet_name.startswith("'") or sheet_name.endswith("'"):
+            raise ValueError("シート名の先頭と末尾には「'」を使用できません。")
+        if len(sheet_name) > self.SHEET_NAME_MAX_LENGTH:
+            truncated = sheet_name[:self.SHEET_NAME_MAX_LENGTH]
+            logger.warning(f"シート名が{self.SHEET_NAME_MAX_LENGTH}文字を超えているため、'{truncated}' に短縮します")
+            sheet_name = truncated
+        
         self.md_file = md_file
         # 出力ファイル名が指定されていない場合は入力ファイル名から生成
         if output_file is None:
@@ -70,20 +465,14 @@ class MdToExcelConverter:
             self.output_file = output_file
             
         # 出力パスの検証
-        output_path = Path(self.output_file)
-        try:
-            # 親ディレクトリが存在するか確認
-            if not output_path.parent.exists():
-                logger.info(f"出力ディレクトリ '{output_path.parent}' が存在しないため作成します")
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            logger.error(f"出力ディレクトリの作成中にエラーが発生しました: {str(e)}")
-            raise
+        self._ensure_output_dir()
         
         self.sheet_name = sheet_name
-        self.sections = []  # 各セクション（見出し、段落、表など）を格納
-        self.current_row = 1
+        # 各セクション（見出し、段落、表など）を格納
+        # parse_markdownで設定される。xlsxwriterでのconvertは解析しながら出力するため設定しない
+        self.sections = []
         self.debug = debug
+        self.engine = engine
         
         # バージョンと実行情報を表示
         logger.info(f"MD to Excel Converter v{self.VERSION}")
@@ -91,13 +480,132 @@ class MdToExcelConverter:
         logger.info(f"入力ファイル: {self.md_file}")
         logger.info(f"出力ファイル: {self.output_file}")
         logger.info(f"シート名: {self.sheet_name}")
+        logger.info(f"出力エンジン: {self.engine}")
         logger.info("-" * 50)
 
+    def _ensure_output_dir(self):
+        """
+        出力ファイルの親ディレクトリが存在しない場合は作成する
+        """
+        output_path = Path(self.output_file)
+        try:
+            # 親ディレクトリが存在するか確認
+            if not output_path.parent.exists():
+                logger.info(f"出力ディレクトリ '{output_path.parent}' が存在しないため作成します")
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"出力ディレクトリの作成中にエラーが発生しました: {str(e)}")
+            raise
+
+    def _detect_encoding(self, raw):
+        """
+        ファイル先頭部分のバイト列からエンコーディングを判定する
+        BOMとASCIIのみの場合は即座に判定し、それ以外はUTF-8として読めるかを最初に確認する
+        UTF-8で読めない場合は他の対応エンコーディングを順に試し、複数で読める場合のみ文字コード判定ライブラリで選ぶ
+        
+        Parameters:
+            raw (bytes): ファイルの先頭部分
+            
+        Returns:
+            str: デコードに使用するエンコーディング名
+        """
+        if raw.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if raw.isascii():
+            # ASCIIのみの場合はその上位互換であるUTF-8とみなす
+            # ISO-2022-JPは7ビットのため、エスケープシーケンスの有無で判別する
+            return 'iso-2022-jp' if b'\x1b$' in raw else 'utf-8'
+        
+        # UTF-8として正しく読める場合は常にUTF-8とする（短いテキストでは判定ライブラリが誤判定しやすいため）
+        # 先頭部分の末尾で途切れたマルチバイト文字はエラーとしない
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(raw, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            logger.debug("UTF-8では読み込めませんでした。他のエンコーディングを判定します。")
+        
+        # UTF-8以外の対応エンコーディングのうち、先頭部分を正しく読めるものを候補とする
+        candidates = []
+        for encoding in self.ENCODINGS[1:]:
+            try:
+                # 先頭部分の末尾で途切れたマルチバイト文字はエラーとしない
+                codecs.getincrementaldecoder(encoding)().decode(raw, final=False)
+                candidates.append(encoding)
+            except UnicodeDecodeError:
+                logger.debug(f"エンコーディング {encoding} では読み込めませんでした。別のエンコーディングを試します。")
+        
+        # 複数のエンコーディングで読める場合のみ、文字コード判定ライブラリで候補の中から選ぶ
+        # 非ASCII文字が少ない短いテキストは判定が不安定なため、ENCODINGSの順で先頭の候補とする
+        non_ascii_bytes = len(raw.translate(None, _ASCII_BYTES))  # ASCIIのバイトを削除した残り
+        if len(candidates) > 1 and non_ascii_bytes >= _DETECT_MIN_NON_ASCII_BYTES:
+            try:
+                from charset_normalizer import from_bytes
+            except ImportError:
+                logger.debug("charset_normalizerがインストールされていないため、候補の先頭のエンコーディングを使用します")
+            else:
+                # 先頭部分の末尾で途切れたマルチバイト文字があると判定できなくなるため、
+                # ファイルの途中までの場合は最後の改行までに切り詰めて渡す
+                if len(raw) >= _DETECT_SAMPLE_SIZE and b'\n' in raw:
+                    raw = raw[:raw.rindex(b'\n') + 1]
+                best = from_bytes(raw, cp_isolation=candidates).best()
+                if best is not None:
+                    return best.encoding
+        if candidates:
+            return candidates[0]
+        
+        raise UnicodeError(f"ファイル '{self.md_file}' は対応しているエンコーディングで読み込めませんでした。UTF-8で保存し直してください。")
+
     @log_exceptions
     def parse_markdown(self):
         """
         Markdownファイルを解析し、セクション構造として抽出する
         """
+        self.sections = list(self._read_sections())
+        
+        # 結果を出力（デバッグ時のみ。無効な場合は書式化も行わない）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("セクション数: %d", len(self.sections))
+            for i, section in enumerate(self.sections, start=1):
+                self._log_section(i, section)
+
+    def _log_section(self, index, section):
+        """
+        セクションの概要をデバッグログに出力する
+        
+        Parameters:
+            index (int): セクションの番号（1始まり）
+            section (dict): セクション
+        """
+        logger.debug("  セクション %d: %s (レベル %d)", index, section['heading'], section['level'])
+        logger.debug("    段落数: %d", len(section['paragraphs']))
+        logger.debug("    リスト数: %d", len(section['lists']))
+        logger.debug("    表数: %d", len(section['tables']))
+
+    def _iter_logged_sections(self, sections):
+        """
+        セクションを順に返しながら、各セクションの概要をデバッグログに出力する
+        解析しながら出力する場合に、parse_markdownと同じ概要を出力するために使用する
+        
+        Parameters:
+            sections (iterable): セクションのイテレータ
+            
+        Yields:
+            dict: セクション
+        """
+        count = 0
+        for count, section in enumerate(sections, start=1):
+            self._log_section(count, section)
+            yield section
+        logger.debug("セクション数: %d", count)
+
+    def _read_sections(self):
+        """
+        Markdownファイルを検証してエンコーディングを判定し、セクションを順に返すイテレータを作成する
+        ファイルの検証とエンコーディングの判定はこの呼び出しの時点で行い、解析はイテレータの消費に合わせて進める
+        
+        Returns:
+            iterator: セクション（見出し、段落、リスト、表）を完成したものから順に返すイテレータ
+        """
         logger.info(f"Markdownファイルを解析中: {self.md_file}")
         
         # ファイルパスの検証
@@ -107,204 +615,84 @@ class MdToExcelConverter:
         if not md_path.is_file():
             raise ValueError(f"'{self.md_file}' はファイルではありません。")
             
-        # ファイルの読み込みを試行（エンコーディングの自動検出）
-        encodings = ['utf-8', 'shift-jis', 'euc-jp', 'iso-2022-jp']
-        lines = None
+        # ファイルの先頭部分だけを読み込んでエンコーディングを自動検出する
+        try:
+            with open(self.md_file, 'rb') as file:
+                sample = file.read(_DETECT_SAMPLE_SIZE)
+        except Exception as e:
+            logger.error(f"ファイル '{self.md_file}' を開けませんでした: {str(e)}")
+            raise
         
-        for encoding in encodings:
-            try:
-                with open(self.md_file, 'r', encoding=encoding) as file:
-                    lines = file.readlines()
-                logger.debug(f"ファイルを正常に読み込みました（エンコーディング: {encoding}）")
-                break
-            except UnicodeDecodeError:
-                logger.debug(f"エンコーディング {encoding} では読み込めませんでした。別のエンコーディングを試します。")
-                continue
-            except Exception as e:
-                logger.error(f"ファイル '{self.md_file}' を開けませんでした: {str(e)}")
-                raise
-        
-        if lines is None:
-            raise UnicodeError(f"ファイル '{self.md_file}' は対応しているエンコーディングで読み込めませんでした。UTF-8で保存し直してください。")
-
-        current_section = None
-        current_heading_level = 0
-        in_table = False
-        current_table = []
-        paragraph_lines = []
-        in_list = False
-        current_list = []
-        
-        for line in lines:
-            line = line.rstrip()
-            
-            # 見出しの検出
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if heading_match:
-                # 前の段落を処理
-                if paragraph_lines:
-                    if current_section:
-                        current_section['paragraphs'].append('\n'.join(paragraph_lines))
-                    paragraph_lines = []
-                
-                # 前のリストを処理
-                if in_list and current_list:
-                    if current_section:
-                        current_section['lists'].append(current_list)
-                    current_list = []
-                    in_list = False
-                
-                # 前の表を処理
-                if in_table and current_table:
-                    if current_section:
-                        current_section['tables'].append(current_table)
-                    current_table = []
-                    in_table = False
-                
-                # 新しいセクションを作成
-                level = len(heading_match.group(1))
-                text = heading_match.group(2)
-                
-                current_section = {
-                    'heading': text,
-                    'level': level,
-                    'paragraphs': [],
-                    'lists': [],
-                    'tables': []
-                }
-                
-                self.sections.append(current_section)
-                current_heading_level = level
-                continue
-            
-            # 表の処理
-            if line.startswith('|') and line.endswith('|'):
-                # 前の段落を処理
-                if paragraph_lines:
-                    if current_section:
-                        current_section['paragraphs'].append('\n'.join(paragraph_lines))
-                    paragraph_lines = []
-                
-                # 前のリストを処理
-                if in_list and current_list:
-                    if current_section:
-                        current_section['lists'].append(current_list)
-                    current_list = []
-                    in_list = False
-                
-                if not in_table:
-                    # 新しい表の開始
-                    in_table = True
-                    current_table = []
-                
-                # 表の行を追加
-                cells = [cell.strip() for cell in line.strip('|').split('|')]
-                
-                # セパレータ行（---）をスキップするが、整列情報は保存
-                if all(re.match(r'^[-:\s]+$', cell) for cell in cells):
-                    # セパレータ行の中で整列情報を取得
-                    align_info = []
-                    for cell in cells:
-                        if cell.startswith(':') and cell.endswith(':'):
-                            align_info.append('center')
-                        elif cell.endswith(':'):
-                            align_info.append('right')
-                        else:
-                            align_info.append('left')
-                    
-                    # この表の整列情報として保存
-                    if not hasattr(self, 'table_alignments'):
-                        self.table_alignments = {}
-                    
-                    # 現在のテーブルの位置（セクション内のインデックス）を計算
-                    if current_section:
-                        table_index = len(current_section['tables'])
-                        self.table_alignments[(id(current_section), table_index)] = align_info
-                    
-                    continue
-                
-                current_table.append(cells)
-                continue
-            elif in_table:
-                # 表の終了
-                if current_section and current_table:
-                    current_section['tables'].append(current_table)
-                current_table = []
-                in_table = False
-            
-            # 箇条書きの処理
-            list_match = re.match(r'^(\s*)[-*+]\s+(.+)$', line)
-            if list_match:
-                # 前の段落を処理
-                if paragraph_lines:
-                    if current_section:
-                        current_section['paragraphs'].append('\n'.join(paragraph_lines))
-                    paragraph_lines = []
-                
-                if not in_list:
-                    # 新しいリストの開始
-                    in_list = True
-                    current_list = []
-                
-                # リストアイテムを追加
-                indent = len(list_match.group(1))
-                content = list_match.group(2)
-                current_list.append((indent, content))
-                continue
-            elif in_list and line.strip():
-                # リストの終了（空行でない別の内容があれば終了）
-                if not re.match(r'^\s*[-*+]', line):
-                    if current_section and current_list:
-                        current_section['lists'].append(current_list)
-                    current_list = []
-                    in_list = False
-                    
-                    # 次の処理に続く（この行は通常のテキストとして扱う）
-                else:
-                    # まだリスト内の行である
+        detected = self._detect_encoding(sample)
+        logger.debug(f"エンコーディングを判定しました: {detected}")
+        
+        # 先頭部分から判定したエンコーディングでファイル全体を読めるとは限らないため、
+        # 全体を厳密にデコードできることを確かめ、読めない場合は残りの対応エンコーディングを順に試す
+        # （置換文字による文字化けをExcelに書き出さない）
+        detected_name = codecs.lookup(detected).name
+        candidates = [detected] + [encoding for encoding in self.ENCODINGS
+                                   if codecs.lookup(encoding).name != detected_name]
+        for encoding in candidates:
+            if len(sample) < _DETECT_SAMPLE_SIZE:
+                # ファイル全体が読み込み済みの場合は開き直さず、一括でデコードして行に分割する
+                try:
+                    text = sample.decode(encoding)
+                except UnicodeDecodeError:
+                    logger.debug(f"エンコーディング {encoding} では読み込めませんでした。別のエンコーディングを試します。")
                     continue
-            
-            # 空行の処理
-            if not line.strip():
-                # 前の段落を処理
-                if paragraph_lines:
-                    if current_section:
-                        current_section['paragraphs'].append('\n'.join(paragraph_lines))
-                    paragraph_lines = []
+                if encoding != detected:
+                    logger.debug(f"エンコーディング {encoding} で読み込みます")
                 
-                # 前のリストを処理
-                if in_list and current_list:
-                    if current_section:
-                        current_section['lists'].append(current_list)
-                    current_list = []
-                    in_list = False
-                    
-                continue
+                # 改行コードはテキストモードでの読み込みと同様に「\n」に統一する
+                lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+                if not lines[-1]:
+                    lines.pop()  # 末尾の改行の後ろの空要素
+                return _iter_sections(lines)
             
-            # 通常のテキスト
-            if not in_list:
-                paragraph_lines.append(line)
-        
-        # 残りの段落、リスト、表を処理
-        if paragraph_lines:
-            if current_section:
-                current_section['paragraphs'].append('\n'.join(paragraph_lines))
+            if self._can_decode_file(encoding):
+                if encoding != detected:
+                    logger.debug(f"エンコーディング {encoding} で読み込みます")
+                return self._iter_file_sections(encoding)
+            logger.debug(f"エンコーディング {encoding} では読み込めませんでした。別のエンコーディングを試します。")
         
-        if in_list and current_list:
-            if current_section:
-                current_section['lists'].append(current_list)
+        raise UnicodeError(f"ファイル '{self.md_file}' は対応しているエンコーディングで読み込めませんでした。UTF-8で保存し直してください。")
+
+    def _can_decode_file(self, encoding):
+        """
+        ファイル全体を指定したエンコーディングで厳密にデコードできるかを確かめる
+        一定サイズずつデコードするだけで文字列は保持しないため、メモリ使用量はファイルサイズに依存しない
         
-        if in_table and current_table:
-            if current_section:
-                current_section['tables'].append(current_table)
+        Parameters:
+            encoding (str): 確かめるエンコーディング
+            
+        Returns:
+            bool: ファイル全体をデコードできる場合はTrue
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(self.md_file, 'rb') as file:
+                while True:
+                    chunk = file.read(_READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    decoder.decode(chunk)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def _iter_file_sections(self, encoding):
+        """
+        判定したエンコーディングでファイルを開き直し、全体をメモリに載せずに1行ずつ解析する
         
-        # 結果を出力
-        print(f"セクション数: {len(self.sections)}")
-        for i, section in enumerate(self.sections):
-            print(f"  セクション {i+1}: {section['heading']} (レベル {section['level']})")
-            print(f"    段落数: {len(section['paragraphs'])}")
-            print(f"    リスト数: {len(section['lists'])}")
-            print(f"    表数: {len(section['tables'])}")
+        Parameters:
+            encoding (str): ファイルのエンコーディング（ファイル全体をデコードできることを確認済み）
+            
+        Yields:
+            dict: セクション（見出し、段落、リスト、表）
+        """
+        with open(self.md_file, 'r', encoding=encoding) as file:
+            yield from _iter_sections(_iter_lines(file))
 
     def _get_column_width(self, text):
         """
@@ -317,124 +705,209 @@ class MdToExcelConverter:
         Returns:
             float: 推奨されるカラム幅
         """
-        if text is None:
+        if not text:
             return 10.0
-            
-        # 文字列に変換
-        text = str(text)
         
-        # 文字の種類ごとに幅を計算
-        # 1. 日本語文字（漢字、ひらがな、カタカナ）: 2.0幅
-        japanese_chars = len(re.findall(r'[\u3000-\u303f\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff]', text))
+        # 表では同じ値（単位・フラグ・見出しなど）が繰り返し現れるため、計算結果をキャッシュする
+        return _measure_column_width(str(text))
+
+    def _column_widths_bulk(self, cells_per_col):
+        """
+        列ごとのセルのテキストからカラム幅を一括で計算する
+        テキスト量の多い列では、文字種の判定をNumPyのベクトル演算で行う
         
-        # 2. 全角英数字・記号: 2.0幅
-        fullwidth_chars = len(re.findall(r'[\uff01-\uff60]', text))
+        Parameters:
+            cells_per_col (list): 列ごとのセルのテキストのリスト
+            
+        Returns:
+            list: 列ごとの推奨されるカラム幅
+        """
+        widths = []
+        for cells in cells_per_col:
+            joined = '\n'.join(cells)
+            if len(joined) < _BULK_WIDTH_MIN_CHARS:
+                widths.append(max([self._get_column_width(cell) for cell in cells], default=10.0))
+                continue
+            
+            # UTF-32に変換して1文字を1要素とするコードポイント配列を作成
+            arr = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+            
+            # 日本語文字と全角英数字・記号は2幅、改行は0幅、それ以外は1幅
+            wide = ((arr >= 0x3000) & (arr <= 0x9fff)) | ((arr >= 0xff01) & (arr <= 0xff60))
+            newline = arr == 0x0a
+            char_widths = np.where(newline, 0, np.where(wide, 2, 1))
+            
+            # 改行位置で区切って行ごとの幅を合計し、最も長い行を採用する
+            starts = np.concatenate(([0], np.flatnonzero(newline) + 1))
+            starts = starts[starts < arr.size]
+            best_line = int(np.add.reduceat(char_widths, starts).max())
+            
+            widths.append(min(max(2.0 + best_line * 1.2, 10.0), 60.0))  # 最小10、最大60の幅に制限
+        return widths
+
+    def _get_paragraph_row_height(self, paragraph):
+        """
+        段落を表示する行の高さを計算する
         
-        # 3. 半角英数字・記号: 1.0幅
-        halfwidth_chars = len(text) - japanese_chars - fullwidth_chars
+        Parameters:
+            paragraph (str): 段落のテキスト
+            
+        Returns:
+            float: 行の高さ。改行を含まず既定の高さのままでよい場合はNone
+        """
+        if '\n' not in paragraph:
+            return None
         
-        # 4. 改行文字も考慮（改行ごとに幅が変わる可能性）
-        newlines = text.count('\n')
+        # 行の高さを内容に合わせて自動調整（目安として改行1つにつき15ポイント加算）
+        line_count = paragraph.count('\n') + 1
+        return max(24, 15 * line_count)  # 最低24、それ以上は改行数に応じて
+
+    def _get_column_alignments(self, table):
+        """
+        表のデータセルの水平方向の配置を列ごとに決定する
         
-        # 基本幅 + 各文字タイプの追加幅
-        # 余裕を持たせるために係数1.2をかける
-        width = 2.0 + (japanese_chars * 2.0 + fullwidth_chars * 2.0 + halfwidth_chars * 1.0) * 1.2
+        Parameters:
+            table (dict): 解析済みの表
+            
+        Returns:
+            list: 列ごとの配置（'left'、'right'、'center'のいずれか）
+        """
+        align = table['align'] or []
+        # 1. Markdownの表の整列情報がある場合、そちらを優先
+        # 2. それ以外は、数値（金額など「,」を含むものも含む）の列は右揃え、他は左揃え
+        return [
+            align[col] if col < len(align) else ('right' if is_numeric else 'left')
+            for col, is_numeric in enumerate(table['numeric'])
+        ]
+
+    def _compute_column_widths(self, tables):
+        """
+        表のセルを走査して、列ごとの最大幅を求める
         
-        # 改行がある場合は最大の行の長さを考慮
-        if newlines > 0:
-            lines = text.split('\n')
-            max_line_width = max([self._get_column_width(line) for line in lines])
-            width = max(width, max_line_width)
+        Parameters:
+            tables (iterable): 対象の表
             
-        return min(max(width, 10.0), 60.0)  # 最小10、最大60の幅に制限
+        Returns:
+            dict: 列番号（1始まり）をキー、カラム幅を値とする辞書
+        """
+        cells_per_col = []
+        for table in tables:
+            for row_data in table['rows']:
+                for col_index, cell_value in enumerate(row_data):
+                    if col_index == len(cells_per_col):
+                        cells_per_col.append([])
+                    cells_per_col[col_index].append(cell_value)
+        
+        widths = self._column_widths_bulk(cells_per_col)
+        return {col_index: width for col_index, width in enumerate(widths, start=1)}
 
     @log_exceptions
-    def create_excel(self):
+    def create_excel(self, sections=None):
         """
         解析したMarkdownの内容からExcelファイルを生成する
+        
+        Parameters:
+            sections (iterable, optional): 出力するセクション（省略時はparse_markdownの結果）
+                xlsxwriterでは1セクションずつ書き出すため、ジェネレータを渡すと解析しながら出力できる
         """
         logger.info(f"Excelファイルを作成中: {self.output_file}")
         
-        # Excelワークブックの作成
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = self.sheet_name
+        if sections is None:
+            sections = self.sections
         
-        # ワークブック全体のデフォルトフォントをメイリオに設定
-        # 注：openpyxlの制限により、これはワークブックレベルではなく各セルに適用する必要がある
+        if self.engine == 'xlsxwriter':
+            try:
+                import xlsxwriter
+            except ImportError:
+                logger.warning("xlsxwriterがインストールされていないため、openpyxlで出力します")
+            else:
+                self._create_excel_xlsxwriter(xlsxwriter, sections)
+                return
         
-        # スタイルの定義
-        heading_fonts = {
-            1: Font(name='メイリオ', bold=True, size=16, color="000000"),
-            2: Font(name='メイリオ', bold=True, size=14, color="000000"),
-            3: Font(name='メイリオ', bold=True, size=12, color="000000"),
-            4: Font(name='メイリオ', bold=True, size=11, color="000000"),
-            5: Font(name='メイリオ', bold=True, size=10, color="000000"),
-            6: Font(name='メイリオ', bold=True, size=10, color="000000")
-        }
+        # カラム幅の事前計算
+        # 書き込み専用モードでは列の設定を最初の行の書き込み前に済ませるため、全セクションを先に揃える
+        if not isinstance(sections, list):
+            sections = list(sections)
+        column_widths = self._compute_column_widths(
+            table for section in sections for table in section['tables'])
+        self._create_excel_openpyxl(sections, column_widths)
+
+    def _create_excel_openpyxl(self, sections, column_widths):
+        """
+        openpyxlの書き込み専用モードでExcelファイルを生成する
         
-        heading_fills = {
-            1: PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"),
-            2: PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid"),
-            3: PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid"),
-            4: PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid"),
-            5: PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid"),
-            6: PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        }
+        Parameters:
+            sections (list): 出力するセクション
+            column_widths (dict): 列番号をキー、カラム幅を値とする辞書
+        """
+        # Excelワークブックの作成（書き込み専用モードで行を順次ストリーミングする）
+        if not HAS_LXML:
+            logger.debug("lxmlがインストールされていないため、標準のXMLシリアライザを使用します")
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet(self.sheet_name)
         
-        # 境界線スタイル
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        # ワークブック全体のデフォルトフォントをメイリオに設定
+        # 注：openpyxlの制限により、これはワークブックレベルではなく各セルに適用する必要がある
         
+        # スタイルの定義
         # ヘッダースタイル（表用）
         header_font = Font(name='メイリオ', bold=True)
         header_fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
         
-        # 中央揃え
-        center_alignment = Alignment(horizontal='center', vertical='center')
+        # インデント用の配置（箇条書きはインデントレベルごとに使い回す）
+        list_alignments = {}
+        
+        # 表のデータセル用の名前付きスタイルをワークブックに一度だけ登録
+        for name, alignment in (('md_data_left', self._ALIGN_LEFT),
+                                ('md_data_right', self._ALIGN_RIGHT),
+                                ('md_data_center', self._ALIGN_CENTER)):
+            workbook.add_named_style(NamedStyle(
+                name=name, font=self._DATA_FONT, alignment=alignment, border=self._THIN_BORDER))
         
-        # 箇条書きのスタイル
-        list_font = Font(name='メイリオ', size=11)
+        # 表の空のセルは値を持たない罫線付きのセルとし、配置ごとに1つのセルを使い回す
+        # 書き込み専用モードではappendしたセルは1つずつその場で書き出されるため、同じセルを何度渡してもよい
+        empty_data_cells = {}
+        for align in ('left', 'right', 'center'):
+            empty_data_cells[align] = WriteOnlyCell(sheet)
+            empty_data_cells[align].style = f'md_data_{align}'
+        
+        # 書き込み専用モードでは列の設定を最初の行の書き込み前に済ませる必要がある
+        for col_index, width in column_widths.items():
+            col_letter = _COL_LETTERS[col_index - 1] if col_index <= len(_COL_LETTERS) else get_column_letter(col_index)
+            sheet.column_dimensions[col_letter].width = width
         
         # 各セクションを追加
-        for section in self.sections:
-            # 見出しを追加
-            sheet.cell(row=self.current_row, column=1, value=section['heading'])
+        # 書き込み専用モードでは行は追加順に並ぶため、行番号は行の高さの設定にのみ使用する
+        row_idx = 1
+        for section in sections:
+            # 見出しを追加し、スタイルをまとめて設定
+            # 見出しレベルは常に1〜6のため、既定値のスタイルオブジェクトは生成しない
+            level = section['level']
+            cell = self._styled_cell(sheet, section['heading'], font=self._HEADING_FONTS[level],
+                                     fill=self._HEADING_FILLS[level],
+                                     alignment=self._HEADING_ALIGNMENTS[level])  # インデント設定（レベルに応じて）
             
-            # 見出しのスタイル設定
-            cell = sheet.cell(row=self.current_row, column=1)
-            cell.font = heading_fonts.get(section['level'], Font(bold=True))
-            cell.fill = heading_fills.get(section['level'], PatternFill())
+            # 見出しの行の高さを調整（行の書き込み前に設定する）
+            sheet.row_dimensions[row_idx].height = self._HEADING_ROW_HEIGHT
             
-            # インデント設定（レベルに応じて）
-            cell.alignment = Alignment(indent=section['level']-1)
-            
-            # 見出しの行の高さを調整
-            sheet.row_dimensions[self.current_row].height = 24
-            
-            self.current_row += 1
+            sheet.append([cell])
+            row_idx += 1
             
             # 段落を追加
             for paragraph in section['paragraphs']:
-                if paragraph.strip():  # 空の段落はスキップ
-                    cell = sheet.cell(row=self.current_row, column=1, value=paragraph)
-                    cell.font = Font(name='メイリオ', size=11)
-                    
-                    # 改行を含む段落の場合は、セルの書式設定を調整
-                    if '\n' in paragraph:
+                if paragraph and not paragraph.isspace():  # 空の段落はスキップ（strip()による複製を作らない）
+                    # 改行を含む段落の場合は、セルの書式設定と行の高さを調整
+                    row_height = self._get_paragraph_row_height(paragraph)
+                    if row_height is not None:
                         # 折り返し設定を有効にし、上下中央揃えに
-                        cell.alignment = Alignment(wrap_text=True, vertical='center')
-                        
-                        # 行の高さを内容に合わせて自動調整（目安として改行1つにつき15ポイント加算）
-                        line_count = paragraph.count('\n') + 1
-                        row_height = max(24, 15 * line_count)  # 最低24、それ以上は改行数に応じて
-                        sheet.row_dimensions[self.current_row].height = row_height
+                        cell = self._styled_cell(sheet, paragraph, font=self._PARA_FONT,
+                                                 alignment=self._ALIGN_WRAP_CENTER)
+                        sheet.row_dimensions[row_idx].height = row_height
+                    else:
+                        cell = self._styled_cell(sheet, paragraph, font=self._PARA_FONT)
                     
-                    self.current_row += 1
+                    sheet.append([cell])
+                    row_idx += 1
             
             # リストを追加
             for list_items in section['lists']:
@@ -443,92 +916,211 @@ class MdToExcelConverter:
                     indent_level = max(1, indent // 2 + 1)
                     
                     # リストアイテムを追加
-                    cell = sheet.cell(row=self.current_row, column=1, value=f"• {content}")
-                    cell.font = list_font
-                    cell.alignment = Alignment(indent=indent_level)
+                    if indent_level not in list_alignments:
+                        list_alignments[indent_level] = Alignment(indent=indent_level)
                     
-                    self.current_row += 1
+                    sheet.append([self._styled_cell(sheet, f"• {content}", font=self._LIST_FONT,
+                                                    alignment=list_alignments[indent_level])])
+                    row_idx += 1
                 
                 # リストの後に空行を追加
-                self.current_row += 1
+                sheet.append([])
+                row_idx += 1
             
             # 表を追加
             for table in section['tables']:
-                if not table:  # 空の表はスキップ
+                rows = table['rows']
+                if not rows:  # 空の表はスキップ
                     continue
                     
                 # ヘッダー行が存在するか確認
-                if len(table) > 0:
+                if len(rows) > 0:
                     # 表のヘッダー行
-                    for col_index, header in enumerate(table[0], start=1):
-                        cell = sheet.cell(row=self.current_row, column=col_index, value=header)
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = center_alignment
-                        cell.border = thin_border
-                        
-                        # カラム幅の調整
-                        col_letter = get_column_letter(col_index)
-                        sheet.column_dimensions[col_letter].width = self._get_column_width(header)
-                    
-                    self.current_row += 1
+                    sheet.append([
+                        self._styled_cell(sheet, header, font=header_font, fill=header_fill,
+                                          alignment=self._ALIGN_CENTER, border=self._THIN_BORDER)
+                        for header in rows[0]
+                    ])
+                    row_idx += 1
                     
                     # 表のデータ行
-                    # 表の整列情報を取得（存在する場合）
-                    table_align_info = None
-                    if hasattr(self, 'table_alignments'):
-                        table_align_info = self.table_alignments.get((id(section), section['tables'].index(table)), None)
+                    # 列ごとの配置を表ごとに一度だけ決定
+                    column_aligns = self._get_column_alignments(table)
                     
-                    for row_data in table[1:]:
+                    for row_data in rows[1:]:
+                        row = []
                         for col_index, cell_value in enumerate(row_data, start=1):
-                            # 列インデックスが範囲外の場合は空白セルを追加
-                            if col_index <= len(row_data):
-                                cell = sheet.cell(row=self.current_row, column=col_index, value=cell_value)
-                                cell.font = Font(name='メイリオ', size=11)
-                                cell.border = thin_border
-                                
-                                # セルの配置を決定
-                                horizontal_align = 'left'  # デフォルト
-                                
-                                # 1. Markdownの表の整列情報がある場合、そちらを優先
-                                if table_align_info and col_index - 1 < len(table_align_info):
-                                    horizontal_align = table_align_info[col_index - 1]
-                                # 2. それ以外は、数値は右揃え、他は左揃え
-                                else:
-                                    try:
-                                        # 金額など「,」を含む数値文字列のカンマを一時的に除去
-                                        numeric_value = cell_value.replace(',', '') if isinstance(cell_value, str) else cell_value
-                                        # 数値変換を試みる
-                                        float(numeric_value)
-                                        # 数値の場合は右揃え
-                                        horizontal_align = 'right'
-                                    except (ValueError, TypeError, AttributeError):
-                                        # 数値でない場合は左揃え
-                                        horizontal_align = 'left'
-                                
-                                # 配置を設定
-                                cell.alignment = Alignment(horizontal=horizontal_align, vertical='center')
-                                
-                                # カラム幅の再調整
-                                col_letter = get_column_letter(col_index)
-                                current_width = sheet.column_dimensions[col_letter].width
-                                new_width = self._get_column_width(cell_value)
-                                sheet.column_dimensions[col_letter].width = max(current_width, new_width)
+                            if not cell_value:
+                                row.append(empty_data_cells[column_aligns[col_index - 1]])
+                                continue
+                            
+                            cell = WriteOnlyCell(sheet, value=cell_value)
+                            
+                            # 列の配置に対応する名前付きスタイル（フォント・罫線を含む）を設定
+                            cell.style = f'md_data_{column_aligns[col_index - 1]}'
+                            row.append(cell)
                         
-                        self.current_row += 1
+                        sheet.append(row)
+                        row_idx += 1
                 
                 # 表の後に空行を追加
-                self.current_row += 1
+                sheet.append([])
+                row_idx += 1
         
         # ファイルの保存
-        try:
-            # 出力ファイルのディレクトリが存在するか確認
-            output_dir = os.path.dirname(self.output_file)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
-                logger.debug(f"出力ディレクトリを作成しました: {output_dir}")
+        self._save_workbook(lambda: workbook.save(self.output_file))
+
+    def _styled_cell(self, sheet, value, font=None, fill=None, alignment=None, border=None):
+        """
+        書き込み専用シートに追加するスタイル付きのセルを生成する
+        
+        Parameters:
+            sheet (WriteOnlyWorksheet): セルを追加するシート
+            value (str): セルの値
+            font (Font): フォント（Noneの場合は設定しない）
+            fill (PatternFill): 塗りつぶし（Noneの場合は設定しない）
+            alignment (Alignment): 配置（Noneの場合は設定しない）
+            border (Border): 罫線（Noneの場合は設定しない）
+            
+        Returns:
+            WriteOnlyCell: sheet.appendにそのまま渡せるセル
+        """
+        cell = WriteOnlyCell(sheet, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
+
+    def _create_excel_xlsxwriter(self, xlsxwriter, sections):
+        """
+        xlsxwriterのconstant_memoryモードでExcelファイルを生成する
+        行を上から順に一時ファイルへ書き出すため、メモリ使用量はファイルサイズに依存しない
+        
+        Parameters:
+            xlsxwriter (module): インポート済みのxlsxwriterモジュール
+            sections (iterable): 出力するセクション（1つずつ順に処理し、保持しない）
+        """
+        # Markdownのテキストは常に文字列として書き込み、数式やURLへの変換は行わない
+        workbook = xlsxwriter.Workbook(self.output_file, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        sheet = workbook.add_worksheet(self.sheet_name)
+        
+        # 書式の定義（同じ書式は使い回す）
+        heading_formats = {
+            level: workbook.add_format({
+                'font_name': 'メイリオ', 'bold': True, 'font_size': size, 'font_color': '#000000',
+                'bg_color': '#' + color, 'pattern': 1, 'indent': level - 1
+            })
+            for level, (size, color) in enumerate(self._HEADING_PALETTE[1:], start=1)
+        }
+        para_format = workbook.add_format({'font_name': 'メイリオ', 'font_size': 11})
+        para_wrap_format = workbook.add_format({
+            'font_name': 'メイリオ', 'font_size': 11, 'text_wrap': True, 'valign': 'vcenter'
+        })
+        list_formats = {}
+        header_format = workbook.add_format({
+            'font_name': 'メイリオ', 'bold': True, 'bg_color': '#DDEBF7', 'pattern': 1,
+            'align': 'center', 'valign': 'vcenter', 'border': 1
+        })
+        data_formats = {
+            align: workbook.add_format({
+                'font_name': 'メイリオ', 'font_size': 11, 'align': align, 'valign': 'vcenter', 'border': 1
+            })
+            for align in ('left', 'right', 'center')
+        }
+        
+        # 各セクションを追加（constant_memoryモードでは行番号が単調増加である必要がある）
+        # 列の設定は保存時に書き出されるため、カラム幅は表ごとに求めた最大値を最後に設定する
+        column_widths = {}
+        row = 0
+        for section in sections:
+            # 見出しを追加
+            sheet.set_row(row, self._HEADING_ROW_HEIGHT)
+            sheet.write_string(row, 0, section['heading'], heading_formats[section['level']])
+            row += 1
             
-            workbook.save(self.output_file)
+            # 段落を追加
+            for paragraph in section['paragraphs']:
+                if paragraph and not paragraph.isspace():  # 空の段落はスキップ（strip()による複製を作らない）
+                    # 改行を含む段落の場合は、折り返し設定と行の高さを調整
+                    row_height = self._get_paragraph_row_height(paragraph)
+                    if row_height is not None:
+                        sheet.set_row(row, row_height)
+                        sheet.write_string(row, 0, paragraph, para_wrap_format)
+                    else:
+                        sheet.write_string(row, 0, paragraph, para_format)
+                    row += 1
+            
+            # リストを追加
+            for list_items in section['lists']:
+                for indent, content in list_items:
+                    # インデントレベルを計算（スペース4つを1レベルと仮定）
+                    indent_level = max(1, indent // 2 + 1)
+                    if indent_level not in list_formats:
+                        list_formats[indent_level] = workbook.add_format({
+                            'font_name': 'メイリオ', 'font_size': 11, 'indent': indent_level
+                        })
+                    sheet.write_string(row, 0, f"• {content}", list_formats[indent_level])
+                    row += 1
+                
+                # リストの後に空行を追加
+                row += 1
+            
+            # 表を追加
+            for table in section['tables']:
+                rows = table['rows']
+                if not rows:  # 空の表はスキップ
+                    continue
+                
+                # 表のヘッダー行
+                for col_index, header in enumerate(rows[0]):
+                    sheet.write_string(row, col_index, header, header_format)
+                row += 1
+                
+                # 表のデータ行
+                column_aligns = self._get_column_alignments(table)
+                
+                for row_data in rows[1:]:
+                    for col_index, cell_value in enumerate(row_data):
+                        sheet.write_string(row, col_index, cell_value, data_formats[column_aligns[col_index]])
+                    row += 1
+                
+                # 表の後に空行を追加
+                row += 1
+                
+                for col_index, width in self._compute_column_widths([table]).items():
+                    if width > column_widths.get(col_index, 0.0):
+                        column_widths[col_index] = width
+        
+        for col_index, width in column_widths.items():
+            sheet.set_column(col_index - 1, col_index - 1, width)
+        
+        def close():
+            try:
+                workbook.close()
+            except xlsxwriter.exceptions.FileCreateError as e:
+                # 保存先を開けなかった場合は元のOSError（PermissionErrorなど）として扱う
+                raise e.args[0]
+        
+        self._save_workbook(close)
+
+    def _save_workbook(self, save):
+        """
+        ワークブックを保存し、保存時のエラーをログに記録する
+        
+        Parameters:
+            save (callable): ワークブックを出力ファイルに書き出す関数
+        """
+        try:
+            save()
             logger.info(f"ファイルを保存しました: {self.output_file}")
         except PermissionError:
             logger.error(f"エラー: ファイル '{self.output_file}' が他のプログラムで開かれているため保存できません。")
@@ -544,12 +1136,22 @@ class MdToExcelConverter:
     def convert(self):
         """
         変換プロセスを実行する
+        xlsxwriterでは解析と出力を同時に行うため、self.sectionsは設定されない
+        （解析結果が必要な場合はparse_markdownとcreate_excelを順に呼び出す）
         """
         start_time = datetime.now()
         logger.debug(f"変換開始: {start_time.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}")
         
-        self.parse_markdown()
-        self.create_excel()
+        if self.engine == 'xlsxwriter':
+            # 解析しながら1セクションずつ書き出し、文書全体のセクションをメモリに保持しない
+            # （このためself.sectionsは設定されない）
+            sections = self._read_sections()
+            if logger.isEnabledFor(logging.DEBUG):
+                sections = self._iter_logged_sections(sections)
+            self.create_excel(sections)
+        else:
+            self.parse_markdown()
+            self.create_excel()
         
         end_time = datetime.now()
         elapsed = end_time - start_time
@@ -571,6 +1173,8 @@ def main():
     parser.add_argument("-d", "--debug", action="store_true", help="デバッグ情報を表示")
     parser.add_argument("-v", "--version", action="store_true", help="バージョン情報を表示して終了")
     parser.add_argument("--overwrite", action="store_true", help="既存のファイルを上書きする（警告を表示しない）")
+    parser.add_argument("--engine", choices=MdToExcelConverter.ENGINES, default="xlsxwriter",
+                        help="Excelの出力エンジン（デフォルト: xlsxwriter。未インストールの場合はopenpyxlを使用）")
     
     args = parser.parse_args()
     
@@ -608,7 +1212,7 @@ def main():
                     continue
             
             # 変換実行
-            converter = MdToExcelConverter(input_file, output_file, args.sheet)
+            converter = MdToExcelConverter(input_file, output_file, args.sheet, engine=args.engine)
             result_file = converter.convert()
             logging.info(f"変換完了: {result_file}")
             success_count += 1